@@ -14,7 +14,6 @@ from enum import Enum
 from typing import List, Union
 import customtkinter
 import pyautogui as pag
-import numpy as np
 import pytweening
 from deprecated import deprecated
 import utilities.color as clr
@@ -29,6 +28,15 @@ from utilities.window import Window, WindowInitializationError
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
+# Colors isolated by Bot.mouseover_text() when none are specified
+MOUSEOVER_COLORS = [
+    clr.OFF_CYAN,
+    clr.OFF_GREEN,
+    clr.OFF_ORANGE,
+    clr.OFF_WHITE,
+    clr.OFF_YELLOW,
+]
+
 
 class BotThread(threading.Thread):
     def __init__(self, target: callable):
@@ -84,6 +92,8 @@ class Bot(ABC):
    
     options_set: bool = False
     progress: float = 0
+    reported_progress: float = 0  # progress value the UI was last notified of
+    reported_progress_at: float = 0  # time.monotonic() of the last progress notification
     status = BotStatus.STOPPED
     thread: BotThread = None
     
@@ -104,6 +114,8 @@ class Bot(ABC):
         self.description = description
         self.options_builder = OptionsBuilder(bot_title)
         self.win = window
+        # Set when the bot is stopped so that waits in the bot thread can end early
+        self.stop_event = threading.Event()
         
 
     @abstractmethod
@@ -163,6 +175,7 @@ class Bot(ABC):
             self.mouse = Mouse(self.clientpid,RemoteInputEnabled=self.RemoteInputEnabled)
             self.reset_progress()
             self.set_status(BotStatus.RUNNING)
+            self.stop_event.clear()
             self.thread = BotThread(target=self.main_loop)
             self.thread.setDaemon(True)
             self.thread.start()
@@ -186,6 +199,7 @@ class Bot(ABC):
         self.log_msg("Stopping script.")
         if self.status != BotStatus.STOPPED:
             self.set_status(BotStatus.STOPPED)
+            self.stop_event.set()
             self.thread.stop()
             self.thread.join()
         else:
@@ -201,11 +215,15 @@ class Bot(ABC):
         Resets the current progress property to 0 and notifies the controller to update UI.
         """
         self.progress = 0
+        self.reported_progress = 0
+        self.reported_progress_at = time.monotonic()
         self.controller.update_progress()
 
     def update_progress(self, progress: float):
         """
-        Updates the progress property and notifies the controller to update UI.
+        Updates the progress property and notifies the controller to update UI. Bots call this every loop, so the
+        controller is only notified once progress has moved by at least 1% or 10 seconds have passed since the last
+        notification. Completion (100%) is always reported.
         Args:
             progress: float - number between 0 and 1 indicating percentage of progress.
         """
@@ -214,6 +232,11 @@ class Bot(ABC):
         elif progress > 1:
             progress = 1
         self.progress = progress
+        now = time.monotonic()
+        if progress < 1 and progress - self.reported_progress < 0.01 and now - self.reported_progress_at < 10:
+            return
+        self.reported_progress = progress
+        self.reported_progress_at = now
         self.controller.update_progress()
 
     def set_status(self, status: BotStatus):
@@ -251,11 +274,9 @@ class Bot(ABC):
         """
         self.log_msg("Dropping inventory...")
         # Determine slots to skip
-        if skip_slots is None:
-            skip_slots = []
+        skip_slots = set(skip_slots or [])
         if skip_rows > 0:
-            row_skip = list(range(skip_rows * 4))
-            skip_slots = np.unique(row_skip + skip_slots)
+            skip_slots.update(range(skip_rows * 4))
         # Start dropping
         if self.RemoteInputEnabled == True:
             self.mouse.send_modifer_key(401,"shift")
@@ -287,6 +308,7 @@ class Bot(ABC):
             slots: The indices of slots to drop.
         """
         self.log_msg("Dropping items...")
+        slots = set(slots)
         if self.RemoteInputEnabled == True:
             self.mouse.send_modifer_key(401,"shift")
         else:
@@ -351,7 +373,8 @@ class Bot(ABC):
         length = round(length)
         for i in range(length):
             self.log_msg(f"Taking a break... {int(length) - i} seconds left.", overwrite=True)
-            time.sleep(1)
+            if self.stop_event.wait(1):
+                return
         self.log_msg(f"Done taking {length} second break.", overwrite=True)
 
     # --- Player Status Functions ---
@@ -360,17 +383,8 @@ class Bot(ABC):
         Returns whether the player has an HP bar above their head. Useful alternative to using OCR to check if the
         player is in combat. This function only works when the game camera is all the way up.
         """
-        # Position of character relative to the screen
-        char_pos = self.win.game_view.get_center()
-
-        # Make a rectangle around the character
-        offset = 30
-        char_rect = Rectangle.from_points(
-            Point(char_pos.x - offset, char_pos.y - offset),
-            Point(char_pos.x + offset, char_pos.y + offset),
-        )
-        # Take a screenshot of rect
-        char_screenshot = char_rect.screenshot()
+        # Take a screenshot of the area around the character
+        char_screenshot = self.win.character.screenshot()
         # Isolate HP bars in that rectangle
         hp_bars = clr.isolate_colors(char_screenshot, [clr.RED, clr.GREEN])
         # If there are any HP bars, return True
@@ -435,13 +449,7 @@ class Bot(ABC):
             If args are left blank, returns the text in the mouseover area.
         """
         if color is None:
-            color = [
-                clr.OFF_CYAN,
-                clr.OFF_GREEN,
-                clr.OFF_ORANGE,
-                clr.OFF_WHITE,
-                clr.OFF_YELLOW,
-            ]
+            color = MOUSEOVER_COLORS
         if contains is None:
             return ocr.extract_text(self.win.mouseover, ocr.BOLD_12, color)
         return bool(ocr.find_text(contains, self.win.mouseover, ocr.BOLD_12, color))
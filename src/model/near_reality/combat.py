@@ -57,35 +57,44 @@ class NRCombat(NRBot):
         self.mouse.move_to(self.win.cp_tabs[3].random_point())
         self.mouse.click()
 
-        start_time = time.time()
+        start_time = time.monotonic()
         end_time = self.running_time * 60
-        while time.time() - start_time < end_time:
+        while time.monotonic() - start_time < end_time:
             # loot
             if not api.get_is_inv_full() and self.pick_up_loot("Cowhide"):
                 inv_count = len(api.get_inv())
                 self.log_msg("Looting...")
                 loot_timeout = 5  # wait up to 5 seconds to finish picking it up
                 while len(api.get_inv()) == inv_count and loot_timeout > 0:
-                    time.sleep(1)
+                    if self.stop_event.wait(1):
+                        return
                     loot_timeout -= 1
-                time.sleep(0.5)
+                if self.stop_event.wait(0.5):
+                    return
 
             # Try to attack an NPC
             timeout = 60  # check for up to 60 seconds
+            npc_missing = False
             while not self.is_in_combat():
                 if timeout <= 0:
                     self.log_msg("Timed out looking for NPC.")
                     self.stop()
                 npc: RuneLiteObject = self.get_nearest_tagged_NPC()
                 if npc is not None:
+                    npc_missing = False
                     self.log_msg("Attacking NPC...")
                     self.mouse.move_to(npc.random_point())
                     self.mouse.click()
-                    time.sleep(3)
+                    if self.stop_event.wait(3):
+                        return
                     timeout -= 3
                 else:
-                    self.log_msg("No NPC found.")
-                    time.sleep(2)
+                    # Only log when the NPC first goes missing, not on every retry
+                    if not npc_missing:
+                        self.log_msg("No NPC found.")
+                        npc_missing = True
+                    if self.stop_event.wait(2):
+                        return
                     timeout -= 2
 
             # If combat is over, assume we killed the NPC.
@@ -94,12 +103,13 @@ class NRCombat(NRBot):
                 if timeout <= 0:
                     self.log_msg("Timed out fighting NPC.")
                     self.stop()
-                time.sleep(2)
+                if self.stop_event.wait(2):
+                    return
                 timeout -= 2
 
             # Update progress
             self.log_msg("NPC killed.")
-            self.update_progress((time.time() - start_time) / end_time)
+            self.update_progress((time.monotonic() - start_time) / end_time)
 
         self.update_progress(1)
         self.log_msg("Bot has completed all of its iterations.")
@@ -59,23 +59,25 @@ class NRFishing(NRBot):
         failed_searches = 0
 
         # Main loop
-        start_time = time.time()
+        start_time = time.monotonic()
         end_time = self.running_time * 60
-        while time.time() - start_time < end_time:
+        while time.monotonic() - start_time < end_time:
             # Check to drop inventory
             if api.get_is_inv_full():
                 raw_fish = api.get_inv_item_indices(ids.raw_fish)
                 self.drop(slots=raw_fish)
                 fished += len(raw_fish)
                 self.log_msg(f"Fishes fished: ~{fished}")
-                time.sleep(2)
+                if self.stop_event.wait(2):
+                    return
 
             # If not fishing, click fishing spot
             while not self.is_player_doing_action("Fishing"):
                 spot = self.get_nearest_tag(clr.CYAN)
                 if spot is None:
                     failed_searches += 1
-                    time.sleep(2)
+                    if self.stop_event.wait(2):
+                        return
                     if failed_searches > 10:
                         self.log_msg("Failed to find fishing spot.")
                         self.stop()
@@ -83,12 +85,14 @@ class NRFishing(NRBot):
                     self.log_msg("Clicking fishing spot...")
                     self.mouse.move_to(spot.random_point())
                     pag.click()
-                    time.sleep(1)
+                    if self.stop_event.wait(1):
+                        return
                     break
-            time.sleep(3)
+            if self.stop_event.wait(3):
+                return
 
             # Update progress
-            self.update_progress((time.time() - start_time) / end_time)
+            self.update_progress((time.monotonic() - start_time) / end_time)
 
         self.update_progress(1)
         self.log_msg("Finished.")
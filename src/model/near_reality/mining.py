@@ -64,13 +64,14 @@ class NRMining(NRBot):
         failed_searches = 0
 
         # Main loop
-        start_time = time.time()
+        start_time = time.monotonic()
         end_time = self.running_time * 60
-        while time.time() - start_time < end_time:
+        while time.monotonic() - start_time < end_time:
             # Check to drop inventory
             if api.get_is_inv_full():
                 self.drop_all()
-                time.sleep(1)
+                if self.stop_event.wait(1):
+                    return
                 continue
 
             # Check to logout
@@ -83,7 +84,8 @@ class NRMining(NRBot):
                 failed_searches += 1
                 if failed_searches > 5:
                     self.__logout("Failed to find a rock to mine. Logging out.")
-                time.sleep(1)
+                if self.stop_event.wait(1):
+                    return
                 continue
 
             # Whack the rock
@@ -98,7 +100,7 @@ class NRMining(NRBot):
             self.log_msg(f"Rocks mined: {mined}")
 
             # Update progress
-            self.update_progress((time.time() - start_time) / end_time)
+            self.update_progress((time.monotonic() - start_time) / end_time)
 
         self.update_progress(1)
         self.__logout("Finished.")
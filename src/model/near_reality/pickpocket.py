@@ -12,6 +12,13 @@ from model.near_reality.nr_bot import NRBot
 from utilities.api.status_socket import StatusSocket
 from utilities.geometry import Point, RuneLiteObject
 
+# Pickpocket option label -> (option index, y offset of the option in the right-click menu, log message)
+PICKPOCKET_OPTIONS = {
+    "Left-click": (0, 0, "Left click pickpocket enabled."),
+    "2nd option": (1, 41, "Right click pickpocket enabled - 2nd option."),
+    "3rd option": (2, 56, "Right click pickpocket enabled - 3rd option."),
+}
+
 
 class NRPickpocket(NRBot):
     def __init__(self):
@@ -23,7 +30,7 @@ class NRPickpocket(NRBot):
         super().__init__(bot_title=title, description=description)
         self.running_time = 5
         self.logout_on_friends = False
-        self.pickpocket_option = 1
+        self.pickpocket_option, self.pickpocket_menu_y, _ = PICKPOCKET_OPTIONS["2nd option"]
         self.should_click_coin_pouch = True
         self.should_drop_inv = True
         self.protect_rows = 5
@@ -57,15 +64,9 @@ class NRPickpocket(NRBot):
                     self.logout_on_friends = False
                     self.log_msg("Bot will not logout when friends are nearby.")
             elif option == "pickpocket_option":
-                if res == "Left-click":
-                    self.pickpocket_option = 0
-                    self.log_msg("Left click pickpocket enabled.")
-                elif res == "2nd option":
-                    self.pickpocket_option = 1
-                    self.log_msg("Right click pickpocket enabled - 2nd option.")
-                elif res == "3rd option":
-                    self.pickpocket_option = 2
-                    self.log_msg("Right click pickpocket enabled - 3rd option.")
+                if res in PICKPOCKET_OPTIONS:
+                    self.pickpocket_option, self.pickpocket_menu_y, msg = PICKPOCKET_OPTIONS[res]
+                    self.log_msg(msg)
             elif option == "should_click_coin_pouch":
                 if res == "Yes":
                     self.should_click_coin_pouch = True
@@ -118,9 +119,9 @@ class NRPickpocket(NRBot):
         no_pouch_count = 0
 
         # Main loop
-        start_time = time.time()
+        start_time = time.monotonic()
         end_time = self.running_time * 60
-        while time.time() - start_time < end_time:
+        while time.monotonic() - start_time < end_time:
             # Check if we should eat
             while self.get_hp() < 50:
                 food_indexes = api.get_inv_item_indices(item_ids.all_food)
@@ -129,11 +130,12 @@ class NRPickpocket(NRBot):
                     self.mouse.move_to(self.win.inventory_slots[food_indexes[0]].random_point())
                     self.mouse.click()
                     if len(food_indexes) > 1:  # eat another if available
-                        time.sleep(1)
+                        if self.stop_event.wait(1):
+                            return
                         self.mouse.move_to(self.win.inventory_slots[food_indexes[1]].random_point())
                         self.mouse.click()
                 else:
-                    self.__logout(f"Out of food. Bot ran for {(time.time() - start_time) / 60} minutes.")
+                    self.__logout(f"Out of food. Bot ran for {(time.monotonic() - start_time) / 60} minutes.")
 
             # Check if we should drop inventory
             if self.should_drop_inv and api.get_is_inv_full():
@@ -154,21 +156,19 @@ class NRPickpocket(NRBot):
                     continue
                 if self.pickpocket_option != 0:
                     self.mouse.right_click()
-                    if self.pickpocket_option == 1:
-                        delta_y = 41
-                    elif self.pickpocket_option == 2:
-                        delta_y = 56
-                    self.mouse.move_rel(x=5, y=delta_y, x_var=25, y_var=4, mouseSpeed="fastest")
+                    self.mouse.move_rel(x=5, y=self.pickpocket_menu_y, x_var=25, y_var=4, mouseSpeed="fastest")
                 self.mouse.click()
                 if self.pickpocket_option == 0:
-                    time.sleep(0.3)
+                    if self.stop_event.wait(0.3):
+                        return
                 npc_search_fail_count = 0
                 theft_count += 1
             else:
                 npc_search_fail_count += 1
-                time.sleep(1)
+                if self.stop_event.wait(1):
+                    return
                 if npc_search_fail_count > 39:
-                    self.__logout(f"No NPC found for {npc_search_fail_count} seconds. Bot ran for {(time.time() - start_time) / 60} minutes.")
+                    self.__logout(f"No NPC found for {npc_search_fail_count} seconds. Bot ran for {(time.monotonic() - start_time) / 60} minutes.")
 
             # Click coin pouch
             stack_size = api.get_inv_item_stack_amount(item_ids.coin_pouches)
@@ -182,7 +182,8 @@ class NRPickpocket(NRBot):
                         tween=pytweening.easeInOutQuad,
                     )
                     self.mouse.click(force_delay=True)
-                    time.sleep(0.1)
+                    if self.stop_event.wait(0.1):
+                        return
                     self.mouse.click(force_delay=True)
                     no_pouch_count = 0
                 else:
@@ -194,10 +195,10 @@ class NRPickpocket(NRBot):
 
             # Check for mods
             if self.logout_on_friends and self.friends_nearby():
-                self.__logout(f"Friends detected nearby. Bot ran for {round((time.time() - start_time) / 60)} minutes.")
+                self.__logout(f"Friends detected nearby. Bot ran for {round((time.monotonic() - start_time) / 60)} minutes.")
 
             # Update progress
-            self.update_progress((time.time() - start_time) / end_time)
+            self.update_progress((time.monotonic() - start_time) / end_time)
 
         self.update_progress(1)
         self.__logout("Finished.")
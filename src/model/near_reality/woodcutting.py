@@ -64,15 +64,16 @@ class OSNRWoodcutting(NRBot):
         failed_searches = 0
 
         # Main loop
-        start_time = time.time()
+        start_time = time.monotonic()
         end_time = self.running_time * 60
-        while time.time() - start_time < end_time:
+        while time.monotonic() - start_time < end_time:
             # If inventory is full
             if api.get_is_inv_full():
                 self.drop_all(skip_slots=list(range(self.protect_slots)))
                 logs += 28 - self.protect_slots
                 self.log_msg(f"Logs cut: ~{logs}")
-                time.sleep(1)
+                if self.stop_event.wait(1):
+                    return
                 continue
 
             # Check to logout
@@ -85,26 +86,29 @@ class OSNRWoodcutting(NRBot):
                 failed_searches += 1
                 if failed_searches > 10:
                     self.__logout("No tagged trees found. Logging out.")
-                time.sleep(1)
+                if self.stop_event.wait(1):
+                    return
                 continue
 
             # Click tree and wait to start cutting
             self.mouse.move_to(tree.random_point())
             self.mouse.click()
-            time.sleep(5)
+            if self.stop_event.wait(5):
+                return
 
             # Wait so long as the player is cutting
             # -Could alternatively check the API for the player's idle status-
             timer = 0
             while self.is_player_doing_action("Woodcutting"):
-                self.update_progress((time.time() - start_time) / end_time)
-                if timer % 6 == 0:
+                self.update_progress((time.monotonic() - start_time) / end_time)
+                if timer == 0:  # only log when we start chopping, not every few seconds while chopping
                     self.log_msg("Chopping tree...")
-                time.sleep(2)
+                if self.stop_event.wait(2):
+                    return
                 timer += 2
             self.log_msg("Idle...")
 
-            self.update_progress((time.time() - start_time) / end_time)
+            self.update_progress((time.monotonic() - start_time) / end_time)
 
         self.update_progress(1)
         self.__logout("Finished.")
@@ -7,7 +7,6 @@ import utilities.color as clr
 import utilities.game_launcher as launcher
 from model.bot import BotStatus
 from model.osrs.osrs_bot import OSRSBot
-from utilities.api.morg_http_client import MorgHTTPSocket
 from utilities.api.status_socket import StatusSocket
 
 
@@ -100,66 +99,74 @@ class OSRSCombat(OSRSBot, launcher.Launchable):
     def main_loop(self):
         self.log_msg("WARNING: This script is for testing and may not be safe for personal use. Please modify it to suit your needs.")
 
-        # Setup API
+        # Setup API (imported here so that loading the bot list doesn't initialize the HTTP client)
+        from utilities.api.morg_http_client import MorgHTTPSocket
+
         api_morg = MorgHTTPSocket()
         api_status = StatusSocket()
 
-        self.toggle_auto_retaliate(True)
-
-        self.log_msg("Selecting inventory...")
-        self.mouse.move_to(self.win.cp_tabs[3].random_point())
-        self.mouse.click()
-
-        failed_searches = 0
-
-        # Main loop
-        start_time = time.time()
-        end_time = self.running_time * 60
-        while time.time() - start_time < end_time:
-            # If inventory is full...
-            if api_status.get_is_inv_full():
-                self.log_msg("Inventory is full. Idk what to do.")
-                self.set_status(BotStatus.STOPPED)
-                return
-
-            # While not in combat
-            while not api_morg.get_is_in_combat():
-                # Find a target
-                target = self.get_nearest_tagged_NPC()
-                if target is None:
-                    failed_searches += 1
-                    if failed_searches % 10 == 0:
-                        self.log_msg("Searching for targets...")
-                    if failed_searches > 60:
-                        # If we've been searching for a whole minute...
-                        self.__logout("No tagged targets found. Logging out.")
+        try:
+            self.toggle_auto_retaliate(True)
+
+            self.log_msg("Selecting inventory...")
+            self.mouse.move_to(self.win.cp_tabs[3].random_point())
+            self.mouse.click()
+
+            failed_searches = 0
+
+            # Main loop
+            start_time = time.monotonic()
+            end_time = self.running_time * 60
+            while time.monotonic() - start_time < end_time:
+                # If inventory is full...
+                if api_status.get_is_inv_full():
+                    self.log_msg("Inventory is full. Idk what to do.")
+                    self.set_status(BotStatus.STOPPED)
+                    return
+
+                # While not in combat
+                while not api_morg.get_is_in_combat():
+                    # Find a target
+                    target = self.get_nearest_tagged_NPC()
+                    if target is None:
+                        failed_searches += 1
+                        if failed_searches % 10 == 0:
+                            self.log_msg("Searching for targets...")
+                        if failed_searches > 60:
+                            # If we've been searching for a whole minute...
+                            self.__logout("No tagged targets found. Logging out.")
+                            return
+                        if self.stop_event.wait(1):
+                            return
+                        continue
+                    failed_searches = 0
+
+                    # Click target if mouse is actually hovering over it, else recalculate
+                    self.mouse.move_to(target.random_point())
+                    if not self.mouseover_text(contains="Attack", color=clr.OFF_WHITE):
+                        continue
+                    self.mouse.click()
+                    if self.stop_event.wait(0.5):
                         return
-                    time.sleep(1)
-                    continue
-                failed_searches = 0
-
-                # Click target if mouse is actually hovering over it, else recalculate
-                self.mouse.move_to(target.random_point())
-                if not self.mouseover_text(contains="Attack", color=clr.OFF_WHITE):
-                    continue
-                self.mouse.click()
-                time.sleep(0.5)
 
-            # While in combat
-            while api_morg.get_is_in_combat():
-                # Check to eat food
-                if self.get_hp() < self.hp_threshold:
-                    self.__eat(api_status)
-                time.sleep(1)
+                # While in combat
+                while api_morg.get_is_in_combat():
+                    # Check to eat food
+                    if self.get_hp() < self.hp_threshold:
+                        self.__eat(api_status)
+                    if self.stop_event.wait(1):
+                        return
 
-            # Loot all highlighted items on the ground
-            if self.loot_items:
-                self.__loot(api_status)
+                # Loot all highlighted items on the ground
+                if self.loot_items:
+                    self.__loot(api_status)
 
-            self.update_progress((time.time() - start_time) / end_time)
+                self.update_progress((time.monotonic() - start_time) / end_time)
 
-        self.update_progress(1)
-        self.__logout("Finished.")
+            self.update_progress(1)
+            self.__logout("Finished.")
+        finally:
+            api_morg.close()
 
     def __eat(self, api: StatusSocket):
         self.log_msg("HP is low.")
@@ -180,12 +187,16 @@ class OSRSCombat(OSRSBot, launcher.Launchable):
                 return
             curr_inv = len(api.get_inv())
             self.log_msg("Picking up loot...")
-            for _ in range(5):  # give the bot 5 seconds to pick up the loot
+            # Give the bot 5 seconds to pick up the loot, checking often so we move on as soon as it's picked up
+            stop_time = time.monotonic() + 5
+            while time.monotonic() < stop_time:
                 if len(api.get_inv()) != curr_inv:
                     self.log_msg("Loot picked up.")
-                    time.sleep(1)
+                    if self.stop_event.wait(1):
+                        return
                     break
-                time.sleep(1)
+                if self.stop_event.wait(0.25):
+                    return
 
     def __logout(self, msg):
         self.log_msg(msg)
@@ -3,8 +3,6 @@ import utilities.api.item_ids as ids
 import utilities.color as clr
 import utilities.random_util as rd
 from model.osrs.osrs_bot import OSRSBot
-from model.runelite_bot import BotStatus
-from utilities.api.morg_http_client import MorgHTTPSocket
 from utilities.api.status_socket import StatusSocket
 from utilities.geometry import RuneLiteObject
 import utilities.ScreenToClient  as stc
@@ -25,6 +23,13 @@ class OSRSWoodcutter(OSRSBot):
         self.win_name = None
         self.pid_number = None
         self.Input = "failed to set mouse input"
+        # Maps each option key to the method that saves it
+        self.__option_handlers = {
+            "running_time": self.__set_running_time,
+            "take_breaks": self.__set_take_breaks,
+            "Client_Info": self.__set_client_info,
+            "Input": self.__set_input,
+        }
     
         
 
@@ -35,34 +40,14 @@ class OSRSWoodcutter(OSRSBot):
         self.options_builder.add_checkbox_option("Input","Choose Input Method",["Remote","PAG"])
 
     def save_options(self, options: dict):
-        for option in options:
-            if option == "running_time":
-                self.running_time = options[option]
-            elif option == "take_breaks":
-                self.take_breaks = options[option] != []
-            elif option == "Client_Info":
-                self.Client_Info = options[option]
-                client_info = str(self.Client_Info)
-                win_name, pid_number = client_info.split(" : ")
-                self.win_name = win_name
-                self.pid_number = int(pid_number)
-                self.win.window_title = self.win_name
-                self.win.window_pid = self.pid_number
-                stc.window_title = self.win_name
-                Mouse.Mouse.clientpidSet = self.pid_number
-            elif option == "Input":
-                self.Input = options[option]
-                if self.Input == ['Remote']:
-                    Mouse.Mouse.RemoteInputEnabledSet = True
-                elif self.Input == ['PAG']:
-                    Mouse.Mouse.RemoteInputEnabledSet = False
-                else:
-                    self.log_msg(f"Failed to set mouse")  
-            else:
+        for option, value in options.items():
+            handler = self.__option_handlers.get(option)
+            if handler is None:
                 self.log_msg(f"Unknown option: {option}")
                 print("Developer: ensure that the option keys are correct, and that options are being unpacked correctly.")
                 self.options_set = False
                 return
+            handler(value)
         self.log_msg(f"Running time: {self.running_time} minutes.")
         self.log_msg(f"Bot will{' ' if self.take_breaks else ' not '}take breaks.")
         self.log_msg("Options set successfully.")
@@ -71,65 +56,100 @@ class OSRSWoodcutter(OSRSBot):
         self.log_msg(f"{self.Input}")
         self.options_set = True
 
+    def __set_running_time(self, value):
+        self.running_time = value
+
+    def __set_take_breaks(self, value):
+        self.take_breaks = value != []
+
+    def __set_client_info(self, value):
+        self.Client_Info = value
+        client_info = str(self.Client_Info)
+        win_name, pid_number = client_info.split(" : ")
+        self.win_name = win_name
+        self.pid_number = int(pid_number)
+        self.win.window_title = self.win_name
+        self.win.window_pid = self.pid_number
+        stc.window_title = self.win_name
+        Mouse.Mouse.clientpidSet = self.pid_number
+
+    def __set_input(self, value):
+        self.Input = value
+        if self.Input == ["Remote"]:
+            Mouse.Mouse.RemoteInputEnabledSet = True
+        elif self.Input == ["PAG"]:
+            Mouse.Mouse.RemoteInputEnabledSet = False
+        else:
+            self.log_msg("Failed to set mouse")
+
     def main_loop(self):
-        # Setup API
+        # Setup API (imported here so that loading the bot list doesn't initialize the HTTP client)
+        from utilities.api.morg_http_client import MorgHTTPSocket
+
         api_m = MorgHTTPSocket()
         api_s = StatusSocket()
 
-        self.log_msg("Selecting inventory...")
-        self.mouse.move_to(self.win.cp_tabs[3].random_point())
-        self.mouse.click()
-
-        self.logs = 0
-        failed_searches = 0
-
-        # Main loop
-        start_time = time.time()
-        end_time = self.running_time * 60
-        while time.time() - start_time < end_time:
-            # 5% chance to take a break between tree searches
-            if rd.random_chance(probability=0.05) and self.take_breaks:
-                self.take_break(max_seconds=30, fancy=True)
-
-            # 2% chance to drop logs early
-            if rd.random_chance(probability=0.02):
-                self.__drop_logs(api_s)
-
-            # If inventory is full, drop logs
-            if api_s.get_is_inv_full():
-                self.__drop_logs(api_s)
-
-            # If our mouse isn't hovering over a tree, and we can't find another tree...
-            if not self.mouseover_text(contains="Chop", color=clr.OFF_WHITE) and not self.__move_mouse_to_nearest_tree():
-                failed_searches += 1
-                if failed_searches % 10 == 0:
-                    self.log_msg("Searching for trees...")
-                if failed_searches > 60:
-                    # If we've been searching for a whole minute...
-                    self.__logout("No tagged trees found. Logging out.")
-                time.sleep(1)
-                continue
-            failed_searches = 0  # If code got here, a tree was found
-
-            # Click if the mouseover text assures us we're clicking a tree
-            if not self.mouseover_text(contains="Chop", color=clr.OFF_WHITE):
-                continue
+        try:
+            self.log_msg("Selecting inventory...")
+            self.mouse.move_to(self.win.cp_tabs[3].random_point())
             self.mouse.click()
-            time.sleep(0.5)
-
-            # While the player is chopping (or moving), wait
-            probability = 0.10
-            while not api_m.get_is_player_idle():
-                # Every second there is a chance to move the mouse to the next tree, lessen the chance as time goes on
-                if rd.random_chance(probability):
-                    self.__move_mouse_to_nearest_tree(next_nearest=True)
-                    probability /= 2
-                time.sleep(1)
-
-            self.update_progress((time.time() - start_time) / end_time)
 
-        self.update_progress(1)
-        self.__logout("Finished.")
+            self.logs = 0
+            failed_searches = 0
+
+            # Main loop
+            start_time = time.monotonic()
+            end_time = self.running_time * 60
+            while time.monotonic() - start_time < end_time:
+                # 5% chance to take a break between tree searches
+                if rd.random_chance(probability=0.05) and self.take_breaks:
+                    self.take_break(max_seconds=30, fancy=True)
+
+                # 2% chance to drop logs early
+                if rd.random_chance(probability=0.02):
+                    self.__drop_logs(api_s)
+
+                # If inventory is full, drop logs
+                if api_s.get_is_inv_full():
+                    self.__drop_logs(api_s)
+
+                # If our mouse isn't hovering over a tree, and we can't find another tree...
+                hovering_tree = self.mouseover_text(contains="Chop", color=clr.OFF_WHITE)
+                if not hovering_tree and not self.__move_mouse_to_nearest_tree():
+                    failed_searches += 1
+                    if failed_searches % 10 == 0:
+                        self.log_msg("Searching for trees...")
+                    if failed_searches > 60:
+                        # If we've been searching for a whole minute...
+                        self.__logout("No tagged trees found. Logging out.")
+                    if self.stop_event.wait(1):
+                        return
+                    continue
+                failed_searches = 0  # If code got here, a tree was found
+
+                # Click if the mouseover text assures us we're clicking a tree (only re-check if the mouse just moved)
+                if not hovering_tree and not self.mouseover_text(contains="Chop", color=clr.OFF_WHITE):
+                    continue
+                self.mouse.click()
+                if self.stop_event.wait(0.5):
+                    return
+
+                # While the player is chopping (or moving), wait
+                probability = 0.10
+                while not api_m.get_is_player_idle():
+                    # Every second there is a chance to move the mouse to the next tree, lessen the chance as time goes on
+                    if rd.random_chance(probability):
+                        self.__move_mouse_to_nearest_tree(next_nearest=True)
+                        probability /= 2
+                    if self.stop_event.wait(1):
+                        return
+
+                self.update_progress((time.monotonic() - start_time) / end_time)
+
+            self.update_progress(1)
+            self.__logout("Finished.")
+        finally:
+            api_m.close()
 
     def __logout(self, msg):
         self.log_msg(msg)
@@ -171,4 +191,4 @@ class OSRSWoodcutter(OSRSBot):
         self.drop(slots)
         self.logs += len(slots)
         self.log_msg(f"Logs cut: ~{self.logs}")
-        time.sleep(1)
\ No newline at end of file
+        self.stop_event.wait(1)
\ No newline at end of file
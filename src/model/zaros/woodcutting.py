@@ -67,19 +67,20 @@ class ZarosWoodcutter(ZarosBot):
         failed_searches = 0
 
         # Last inventory slot color when empty
-        x, y = self.win.inventory_slots[-1].get_center()
-        self.empty_slot_clr = pag.pixel(x, y)
+        self.last_slot_center = self.win.inventory_slots[-1].get_center()
+        self.empty_slot_clr = pag.pixel(*self.last_slot_center)
 
         # Main loop
-        start_time = time.time()
+        start_time = time.monotonic()
         end_time = self.running_time * 60
-        while time.time() - start_time < end_time:
+        while time.monotonic() - start_time < end_time:
             # If inventory is full
             if self.__inv_is_full():
                 self.drop_all(skip_slots=list(range(self.protect_slots)))
                 logs += 28 - self.protect_slots
                 self.log_msg(f"Logs cut: ~{logs}")
-                time.sleep(1)
+                if self.stop_event.wait(1):
+                    return
 
             # Find a tree
             tree = self.get_nearest_tag(clr.PINK)
@@ -90,7 +91,8 @@ class ZarosWoodcutter(ZarosBot):
                 if failed_searches > 60:
                     # If we've been searching for a whole minute...
                     self.__logout("No tagged trees found. Logging out.")
-                time.sleep(1)
+                if self.stop_event.wait(1):
+                    return
                 continue
             failed_searches = 0  # If code got here, a tree was found
 
@@ -102,16 +104,19 @@ class ZarosWoodcutter(ZarosBot):
 
             if first_loop:
                 # Chop for a few seconds to get the Woodcutting plugin to show up
-                time.sleep(5)
+                if self.stop_event.wait(5):
+                    return
                 first_loop = False
 
-            time.sleep(rd.truncated_normal_sample(1, 10, 2, 2))
+            if self.stop_event.wait(rd.truncated_normal_sample(1, 10, 2, 2)):
+                return
 
             # Wait until we're done chopping
             while self.is_player_doing_action("Woodcutting"):
-                time.sleep(1)
+                if self.stop_event.wait(1):
+                    return
 
-            self.update_progress((time.time() - start_time) / end_time)
+            self.update_progress((time.monotonic() - start_time) / end_time)
 
         self.update_progress(1)
         self.__logout("Finished.")
@@ -125,5 +130,4 @@ class ZarosWoodcutter(ZarosBot):
         """
         Private method to check if inventory is full based on the color of the last inventory slot.
         """
-        x, y = self.win.inventory_slots[-1].get_center()
-        return pag.pixel(x, y) != self.empty_slot_clr
+        return pag.pixel(*self.last_slot_center) != self.empty_slot_clr
@@ -6,7 +6,7 @@ from typing import List, Tuple, Union
 
 import requests
 from deprecated import deprecated
-from requests.exceptions import ConnectionError
+from requests.exceptions import ConnectionError, ConnectTimeout
 
 
 class SocketError(Exception):
@@ -29,31 +29,75 @@ class MorgHTTPSocket:
         self.events_endpoint = "events"
 
         self.timeout = 1
+        # Reuse one keep-alive connection for every request rather than opening a new one per call
+        self.session = requests.Session()
 
-    def __do_get(self, endpoint: str) -> dict:
+        # Inventory polls made within this many seconds of each other are served from the cache instead of making
+        # another round-trip to the plugin. Disabled by default; a bot that opts in must call invalidate_cache()
+        # after anything that changes the inventory (E.g., dropping, banking, eating).
+        self.inv_cache_ttl = 0
+        self.__cache = {}
+
+    def __do_get(self, endpoint: str, ttl: float = 0) -> dict:
         """
         Args:
                 endpoint: One of either "inv", "stats", "equip", "events"
+                ttl: If greater than 0, data fetched from this endpoint less than `ttl` seconds ago is returned
+                     from the cache rather than requested again.
         Returns:
                 All JSON data from the endpoint as a dict.
         Raises:
                 SocketError: If the endpoint is not valid or the server is not running.
         """
+        if ttl and endpoint in self.__cache:
+            fetched_at, data = self.__cache[endpoint]
+            if time.monotonic() - fetched_at < ttl:
+                return data
+        url = f"{self.base_endpoint}{endpoint}"
         try:
-            response = requests.get(f"{self.base_endpoint}{endpoint}", timeout=self.timeout)
-        except ConnectionError as e:
+            response = self.session.get(url, timeout=self.timeout)
+        except ConnectTimeout as e:
+            # A fresh connection that couldn't be opened in time won't fare better on a retry
             raise SocketError("Unable to reach socket", endpoint) from e
+        except ConnectionError:
+            # The pooled connection may have gone stale (E.g., the client was restarted), so drop it and retry once
+            self.session.close()
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except ConnectionError as e:
+                raise SocketError("Unable to reach socket", endpoint) from e
 
         if response.status_code != 200:
             if response.status_code == 204:
-                return {}
+                data = {}
             else:
                 raise SocketError(
                     f"Unable to reach socket. Status code: {response.status_code}",
                     endpoint,
                 )
+        else:
+            data = response.json()
+
+        self.__cache[endpoint] = (time.monotonic(), data)
+        return data
 
-        return response.json()
+    def close(self) -> None:
+        """
+        Closes the connection to the socket. It is reopened automatically if another request is made.
+        """
+        self.session.close()
+
+    def invalidate_cache(self, endpoint: str = None) -> None:
+        """
+        Discards cached endpoint data so that the next call fetches fresh data. Call this after performing an
+        action that is known to change the data (E.g., dropping or withdrawing items).
+        Args:
+                endpoint: The endpoint to invalidate. If left blank, all cached data is discarded.
+        """
+        if endpoint is None:
+            self.__cache.clear()
+        else:
+            self.__cache.pop(endpoint, None)
 
     def test_endpoints(self) -> bool:
         """
@@ -61,7 +105,7 @@ class MorgHTTPSocket:
         Returns:
                 True if successful, False otherwise.
         """
-        for i in list(self.__dict__.values())[1:-1]:  # Look away
+        for i in [self.inv_endpoint, self.stats_endpoint, self.equip_endpoint, self.events_endpoint]:
             try:
                 self.__do_get(endpoint=i)
             except SocketError as e:
@@ -119,8 +163,8 @@ class MorgHTTPSocket:
         Returns:
                 True if the player is idle, False otherwise..
         """
-        start_time = time.time()
-        while time.time() - start_time < poll_seconds:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < poll_seconds:
             data = self.__do_get(endpoint=self.events_endpoint)
             if data.get("animation") != -1 or data.get("animation pose") not in [808, 813]:
                 return False
@@ -175,12 +219,15 @@ class MorgHTTPSocket:
             return -1
         return xp_gained
 
-    def wait_til_gained_xp(self, skill: str, timeout: int = 10) -> int:
+    def wait_til_gained_xp(self, skill: str, timeout: int = 10, initial_delay: float = 0.05, max_delay: float = 0.2) -> int:
         """
-        Waits until the player has gained xp in the inputted skill.
+        Waits until the player has gained xp in the inputted skill. The delay between polls starts small and
+        doubles after each miss until it reaches `max_delay`, so xp gained straight away is noticed sooner.
         Args:
                 skill: the name of the skill (not case sensitive).
                 timeout: the maximum amount of time to wait for xp gain (seconds).
+                initial_delay: the delay after the first poll (seconds).
+                max_delay: the most the delay may grow to (seconds).
         Returns:
                 The xp gained of the skill as an int, or -1 if no XP was gained or an error occurred during the timeout.
         """
@@ -189,13 +236,15 @@ class MorgHTTPSocket:
             print("Failed to get starting xp.")
             return -1
 
-        stop_time = time.time() + timeout
-        while time.time() < stop_time:
+        delay = initial_delay
+        stop_time = time.monotonic() + timeout
+        while time.monotonic() < stop_time:
             data = self.__do_get(endpoint=self.stats_endpoint)
             final_xp = next(int(i["xp"]) for i in data[1:] if i["stat"] == skill)
             if final_xp > starting_xp:
                 return final_xp
-            time.sleep(0.2)
+            time.sleep(delay)
+            delay = min(delay * 2, max_delay)
         return -1
 
     def get_game_tick(self) -> int:
@@ -296,6 +345,16 @@ class MorgHTTPSocket:
         data = self.__do_get(endpoint=self.events_endpoint)
         return int(data["npc health "])
 
+    def get_inv(self) -> List[dict]:
+        """
+        Fetches the contents of the player's inventory. If `inv_cache_ttl` is set, repeated calls within that
+        many seconds of each other return the same data.
+        Returns:
+                A list of dicts representing each inventory slot. The list is a copy, so modifying it does not
+                affect the cache.
+        """
+        return [dict(slot) for slot in self.__do_get(endpoint=self.inv_endpoint, ttl=self.inv_cache_ttl)]
+
     def get_if_item_in_inv(self, item_id: Union[List[int], int]) -> bool:
         """
         Checks if an item is in the inventory or not.
@@ -304,10 +363,11 @@ class MorgHTTPSocket:
         Returns:
                 True if the item is in the inventory, False if not.
         """
-        data = self.__do_get(endpoint=self.inv_endpoint)
+        data = self.__do_get(endpoint=self.inv_endpoint, ttl=self.inv_cache_ttl)
         if isinstance(item_id, int):
             return any(inventory_slot["id"] == item_id for inventory_slot in data)
         elif isinstance(item_id, list):
+            item_id = set(item_id)
             return any(inventory_slot["id"] in item_id for inventory_slot in data)
 
     def get_is_inv_full(self) -> bool:
@@ -316,7 +376,7 @@ class MorgHTTPSocket:
         Returns:
                 True if the player's inventory is full, False otherwise.
         """
-        data = self.__do_get(endpoint=self.inv_endpoint)
+        data = self.__do_get(endpoint=self.inv_endpoint, ttl=self.inv_cache_ttl)
         return len([item["id"] for item in data if item["id"] != -1]) == 28
 
     def get_inv_item_indices(self, item_id: Union[List[int], int]) -> list:
@@ -328,10 +388,11 @@ class MorgHTTPSocket:
         Returns:
                 A list of inventory slot indexes that the item(s) exists in.
         """
-        data = self.__do_get(endpoint=self.inv_endpoint)
+        data = self.__do_get(endpoint=self.inv_endpoint, ttl=self.inv_cache_ttl)
         if isinstance(item_id, int):
             return [i for i, inventory_slot in enumerate(data) if inventory_slot["id"] == item_id]
         elif isinstance(item_id, list):
+            item_id = set(item_id)
             return [i for i, inventory_slot in enumerate(data) if inventory_slot["id"] in item_id]
 
     def get_inv_item_stack_amount(self, item_id: Union[int, List[int]]) -> int:
@@ -344,9 +405,8 @@ class MorgHTTPSocket:
         Returns:
             The total amount of that item in your inventory.
         """
-        data = self.__do_get(endpoint=self.inv_endpoint)
-        if isinstance(item_id, int):
-            item_id = [item_id]
+        data = self.__do_get(endpoint=self.inv_endpoint, ttl=self.inv_cache_ttl)
+        item_id = {item_id} if isinstance(item_id, int) else set(item_id)
         if result := next((item for item in data if item["id"] in item_id), None):
             return int(result["quantity"])
         return 0
@@ -360,10 +420,10 @@ class MorgHTTPSocket:
                 True if an item is equipped, False if not.
         """
         data = self.__do_get(endpoint=self.equip_endpoint)
-        equipped_ids = [item["id"] for item in data]
+        equipped_ids = {item["id"] for item in data}
         if isinstance(item_id, int):
             return item_id in equipped_ids
-        return any(item in item_id for item in equipped_ids)
+        return not equipped_ids.isdisjoint(item_id)
 
     def get_equipped_item_quantity(self, item_id: int) -> int:
         """
@@ -146,8 +146,8 @@ class StatusSocket:
                 does not consider movement animations.
         """
         # run a loop for 0.6 second
-        start_time = time.time()
-        while time.time() - start_time < 0.8:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < 0.8:
             if player_data["attack"]["animationId"] != -1:
                 return False
         return True
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -11,6 +12,19 @@ IMAGES = __PATH.joinpath("images")
 BOT_IMAGES = IMAGES.joinpath("bot")
 
 
+@lru_cache(maxsize=None)
+def __load_image(path: str) -> cv2.Mat:
+    """
+    Reads an image from disk. Bots search for the same handful of sprites every loop, so each file is only
+    decoded once and subsequent calls return the image already in memory.
+    Args:
+        path: The path to the image file.
+    Returns:
+        The image as a matrix, including its alpha channel if it has one.
+    """
+    return cv2.imread(path, cv2.IMREAD_UNCHANGED)
+
+
 def __imagesearcharea(template: Union[cv2.Mat, str, Path], im: cv2.Mat, confidence: float) -> Rectangle:
     """
     Locates an image within another image.
@@ -58,10 +72,8 @@ def search_img_in_rect(image: Union[cv2.Mat, str, Path], rect: Union[Rectangle,
         >>> if deposit_all_btn:
         >>>     # Deposit all button was found
     """
-    if isinstance(image, str):
-        image = cv2.imread(image, cv2.IMREAD_UNCHANGED)
-    elif isinstance(image, Path):
-        image = cv2.imread(str(image), cv2.IMREAD_UNCHANGED)
+    if isinstance(image, (str, Path)):
+        image = __load_image(str(image))
     im = rect.screenshot() if isinstance(rect, Rectangle) else rect
 
     if found_rect := __imagesearcharea(image, im, confidence):
@@ -12,6 +12,9 @@ import numpy as np
 
 from utilities.geometry import Point, RuneLiteObject
 
+# Pixels of margin kept around each contour when it is cropped out for processing in `extract_objects`
+ROI_PADDING = 8
+
 
 def extract_objects(image: cv2.Mat) -> List[RuneLiteObject]:
     """
@@ -30,26 +33,31 @@ def extract_objects(image: cv2.Mat) -> List[RuneLiteObject]:
         return []
     # Find the contours
     contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    black_image = np.zeros(mask.shape, dtype="uint8")
+    img_h, img_w = mask.shape[:2]
+    kernel = np.ones((7, 7), np.uint8)
     # Extract the objects from each contoured object
     objs: List[RuneLiteObject] = []
-    for objects in range(len(contours)):
-        if len(contours[objects]) > 2:
+    for contour in contours:
+        if len(contour) > 2:
+            # Work on a crop around the contour instead of a copy of the whole image. The padding keeps the
+            # morphology below from reaching the edges of the crop, so the result is the same as a full-size pass.
+            x, y, w, h = cv2.boundingRect(contour)
+            left, top = max(x - ROI_PADDING, 0), max(y - ROI_PADDING, 0)
+            right, bottom = min(x + w + ROI_PADDING, img_w), min(y + h + ROI_PADDING, img_h)
             # Fill in the outline with white pixels
-            black_copy = black_image.copy()
-            cv2.drawContours(black_copy, contours, objects, (255, 255, 255), -1)
-            kernel = np.ones((7, 7), np.uint8)
+            black_copy = np.zeros((bottom - top, right - left), dtype="uint8")
+            cv2.drawContours(black_copy, [contour], -1, 255, -1, offset=(-left, -top))
             black_copy = cv2.morphologyEx(black_copy, cv2.MORPH_OPEN, kernel)
             black_copy = cv2.erode(black_copy, kernel, iterations=2)
-            if np.count_nonzero(black_copy == 255):
-                indices = np.where(black_copy == [255])
-                if indices[0].size > 0:
-                    x_min, x_max = np.min(indices[1]), np.max(indices[1])
-                    y_min, y_max = np.min(indices[0]), np.max(indices[0])
-                    width, height = x_max - x_min, y_max - y_min
-                    center = [int(x_min + (width / 2)), int(y_min + (height / 2))]
-                    axis = np.column_stack((indices[1], indices[0]))
-                    objs.append(RuneLiteObject(x_min, x_max, y_min, y_max, width, height, center, axis))
+            ys, xs = np.nonzero(black_copy == 255)
+            if ys.size > 0:
+                xs, ys = xs + left, ys + top
+                x_min, x_max = np.min(xs), np.max(xs)
+                y_min, y_max = np.min(ys), np.max(ys)
+                width, height = x_max - x_min, y_max - y_min
+                center = [int(x_min + (width / 2)), int(y_min + (height / 2))]
+                axis = np.column_stack((xs, ys))
+                objs.append(RuneLiteObject(x_min, x_max, y_min, y_max, width, height, center, axis))
     return objs or []
 
 
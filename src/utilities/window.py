@@ -9,6 +9,7 @@ styles, this class should be abstracted, then extended for each interface style.
 """
 import time
 from typing import List
+import cv2
 import pywinctl
 from deprecated import deprecated
 import utilities.debug as debug
@@ -63,6 +64,7 @@ class Window:
     # Game View Area
     game_view: Rectangle = None
     mouseover: Rectangle = None
+    character: Rectangle = None  # area around the player where their HP bar appears
     total_xp: Rectangle = None
 
     def __init__(self, window_title: str, padding_top: int, padding_left: int) -> None:
@@ -153,24 +155,42 @@ class Window:
         """
         start_time = time.time()
         client_rect = self.rectangle()
-        a = self.__locate_minimap(client_rect)
-        b = self.__locate_chat(client_rect)
-        c = self.__locate_control_panel(client_rect)
+        # Capture the client once and search that image for each UI template, rather than re-capturing per template
+        client_img = client_rect.screenshot()
+        a = self.__locate_minimap(client_rect, client_img)
+        b = self.__locate_chat(client_rect, client_img)
+        c = self.__locate_control_panel(client_rect, client_img)
         d = self.__locate_game_view(client_rect)
         if all([a, b, c, d]):  # if all templates found
             print(f"Window.initialize() took {time.time() - start_time} seconds.")
             return True
         raise WindowInitializationError()
 
-    def __locate_chat(self, client_rect: Rectangle) -> bool:
+    def __search_client(self, template: str, client_rect: Rectangle, client_img: cv2.Mat) -> Rectangle:
+        """
+        Searches a screenshot of the client for a UI template.
+        Args:
+            template: The file name of the template within the ui_templates folder.
+            client_rect: The client area the screenshot was taken of.
+            client_img: The screenshot of the client area.
+        Returns:
+            A Rectangle outlining the found template relative to the screen, or None.
+        """
+        if found := imsearch.search_img_in_rect(imsearch.BOT_IMAGES.joinpath("ui_templates", template), client_img):
+            found.left += client_rect.left
+            found.top += client_rect.top
+        return found
+
+    def __locate_chat(self, client_rect: Rectangle, client_img: cv2.Mat) -> bool:
         """
         Locates the chat area on the client.
         Args:
             client_rect: The client area to search in.
+            client_img: A screenshot of the client area.
         Returns:
             True if successful, False otherwise.
         """
-        if chat := imsearch.search_img_in_rect(imsearch.BOT_IMAGES.joinpath("ui_templates", "chat.png"), client_rect):
+        if chat := self.__search_client("chat.png", client_rect, client_img):
             # Locate chat tabs
             self.chat_tabs = []
             x, y = 5, 143
@@ -182,15 +202,16 @@ class Window:
         print("Window.__locate_chat(): Failed to find chatbox.")
         return False
 
-    def __locate_control_panel(self, client_rect: Rectangle) -> bool:
+    def __locate_control_panel(self, client_rect: Rectangle, client_img: cv2.Mat) -> bool:
         """
         Locates the control panel area on the client.
         Args:
             client_rect: The client area to search in.
+            client_img: A screenshot of the client area.
         Returns:
             True if successful, False otherwise.
         """
-        if cp := imsearch.search_img_in_rect(imsearch.BOT_IMAGES.joinpath("ui_templates", "inv.png"), client_rect):
+        if cp := self.__search_client("inv.png", client_rect, client_img):
             self.__locate_cp_tabs(cp)
             self.__locate_inv_slots(cp)
             self.__locate_prayers(cp)
@@ -301,18 +322,22 @@ class Window:
 
             self.game_view.subtract_list = [minimap, chat, control_panel]
         self.mouseover = Rectangle(left=self.game_view.left, top=self.game_view.top, width=407, height=26)
+        # The player is always drawn at the center of the game view
+        char_pos = self.game_view.get_center()
+        self.character = Rectangle(left=char_pos.x - 30, top=char_pos.y - 30, width=60, height=60)
         return True
 
-    def __locate_minimap(self, client_rect: Rectangle) -> bool:
+    def __locate_minimap(self, client_rect: Rectangle, client_img: cv2.Mat) -> bool:
         """
         Locates the minimap area on the clent window and all of its internal positions.
         Args:
             client_rect: The client area to search in.
+            client_img: A screenshot of the client area.
         Returns:
             True if successful, False otherwise.
         """
         # 'm' refers to minimap area
-        if m := imsearch.search_img_in_rect(imsearch.BOT_IMAGES.joinpath("ui_templates", "minimap.png"), client_rect):
+        if m := self.__search_client("minimap.png", client_rect, client_img):
             self.client_fixed = False
             self.compass_orb = Rectangle(left=40 + m.left, top=7 + m.top, width=24, height=26)
             self.hp_orb_text = Rectangle(left=4 + m.left, top=60 + m.top, width=20, height=13)
@@ -324,7 +349,7 @@ class Window:
             self.spec_orb = Rectangle(left=62 + m.left, top=144 + m.top, width=18, height=20)
             self.spec_orb_text = Rectangle(left=36 + m.left, top=151 + m.top, width=20, height=13)
             self.total_xp = Rectangle(left=m.left - 147, top=m.top + 4, width=104, height=21)
-        elif m := imsearch.search_img_in_rect(imsearch.BOT_IMAGES.joinpath("ui_templates", "minimap_fixed.png"), client_rect):
+        elif m := self.__search_client("minimap_fixed.png", client_rect, client_img):
             self.client_fixed = True
             self.compass_orb = Rectangle(left=31 + m.left, top=7 + m.top, width=24, height=25)
             self.hp_orb_text = Rectangle(left=4 + m.left, top=55 + m.top, width=20, height=13)